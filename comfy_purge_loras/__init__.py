@@ -1,76 +1,338 @@
----
-
-### `comfy_purge_loras/__init__.py`
-
-```python
 # comfy-purge-loras
 # ComfyUI custom node: Purge LoRAs When Disk Full
 # Path: comfy_purge_loras/__init__.py
 
-import math
+import os
+import re
+import heapq
+import io
+import json
 import time
 import shutil
+import stat
+from array import array
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import List, Tuple
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
 
 __all__ = ["NODE_CLASS_MAPPINGS", "NODE_DISPLAY_NAME_MAPPINGS"]
 __version__ = "1.0.0"
 
+# Directory scans are metadata-bound, so overlap them on a small thread pool.
+_SCAN_WORKERS = 8
+# Accepted files are stat'ed in batches of this many paths per pool task.
+_STAT_BATCH = 256
+# On Windows DirEntry.stat() is filled in by the directory listing itself.
+_DIRENTRY_STAT_IS_FREE = os.name == "nt"
+# Windows has no statvfs; disk usage falls back to shutil there.
+_HAS_STATVFS = hasattr(os, "statvfs")
+# Re-sync the running usage estimate with the real filesystem this often while purging.
+_USAGE_RESYNC_EVERY = 32
+# Non-verbose logs keep this many deletion lines from each end of the list.
+_LOG_EDGE_ENTRIES = 100
+# Unlinks are overlapped on this many threads, with at most this many queued at once.
+_UNLINK_WORKERS = 8
+_UNLINK_MAX_IN_FLIGHT = 16
+# How long a remembered "trash was empty" mtime may be trusted.
+_TRASH_STATE_MAX_AGE = 24 * 3600
+# Delete limits up to this pick their files with a bounded heap while scanning.
+_STREAM_SELECT_MAX = 8
+# Smallest first batch when picking the oldest files with a heap.
+_MIN_SELECT_K = 16
+# Skip the heap and sort outright when k covers 1/8 of the candidates.
+_SORT_REST_FRACTION = 8
+
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
 # ------------- helpers -------------
 
 def _format_bytes(n: int) -> str:
     if n <= 0:
         return "0 B"
-    units = ["B", "KB", "MB", "GB", "TB"]
-    i = min(int(math.log(n, 1024)), len(units) - 1)
-    return f"{n / (1024 ** i):.2f} {units[i]}"
-
-def _disk_usage_percent(path: Path) -> float:
-    """Return used percentage [0..100] for filesystem holding 'path'."""
+    # floor(log1024(n)) straight from the bit length; no float log needed
+    i = min((int(n).bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{n / (1 << (10 * i)):.2f} {_BYTE_UNITS[i]}"
+
+class _DiskUsage(NamedTuple):
+    """Capacity snapshot for the filesystem holding a path; 'total' is stable for a run."""
+    total: int
+    used: int
+
+    @property
+    def used_pct(self) -> float:
+        """Used percentage [0..100]."""
+        return (self.used / (self.total or 1)) * 100.0
+
+def _disk_usage(path: Path) -> _DiskUsage:
+    if _HAS_STATVFS:
+        # Same numbers as shutil.disk_usage, without its intermediate named tuple
+        st = os.statvfs(path)
+        return _DiskUsage(st.f_blocks * st.f_frsize, (st.f_blocks - st.f_bfree) * st.f_frsize)
     usage = shutil.disk_usage(path)
-    used = usage.used
-    total = usage.total if usage.total else 1
-    return (used / total) * 100.0
+    return _DiskUsage(usage.total, usage.used)
+
+class _ScannedFiles(NamedTuple):
+    """Scanned files as parallel columns; index i of each column describes the same file."""
+    paths: List[str]
+    mtimes: array
+    sizes: array
+
+    @classmethod
+    def empty(cls) -> "_ScannedFiles":
+        return cls([], array("d"), array("q"))
+
+    def add(self, path: str, st: os.stat_result) -> None:
+        self.paths.append(path)
+        self.mtimes.append(st.st_mtime)
+        self.sizes.append(st.st_size)
+
+    def extend(self, other: "_ScannedFiles") -> None:
+        self.paths.extend(other.paths)
+        self.mtimes.extend(other.mtimes)
+        self.sizes.extend(other.sizes)
+
+_ScanResult = Tuple[_ScannedFiles, List[str], List[str]]
+
+def _scan_dir(path: str, accept: Optional[Callable[[str], bool]]) -> _ScanResult:
+    """
+    Scan one directory level by name only.
+    Returns (stat'ed files, accepted file paths still to stat, subdirectories).
+    """
+    files = _ScannedFiles.empty()
+    to_stat: List[str] = []
+    subdirs: List[str] = []
+    try:
+        it = os.scandir(path)
+    except OSError:
+        return files, to_stat, subdirs
+    with it:
+        for entry in it:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                    continue
+                if not entry.is_file():
+                    continue
+                if accept is not None and not accept(entry.name):
+                    continue
+                if _DIRENTRY_STAT_IS_FREE:
+                    files.add(entry.path, entry.stat())
+                else:
+                    to_stat.append(entry.path)
+            except OSError:
+                # Vanished, or a broken/looping symlink: skip it like Path.is_file() did
+                continue
+    return files, to_stat, subdirs
+
+def _stat_batch(paths: List[str]) -> _ScanResult:
+    """Stat a batch of file paths; vanished or unreadable files are dropped."""
+    files = _ScannedFiles.empty()
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        files.add(path, st)
+    return files, [], []
+
+def _iter_scandir_parallel(
+    root: str,
+    accept: Optional[Callable[[str], bool]] = None,
+    workers: int = _SCAN_WORKERS,
+) -> Iterator[_ScannedFiles]:
+    """
+    Recursively walk 'root', scanning subdirectories concurrently on a thread pool,
+    and yield accepted files batch by batch as they are stat'ed.
+    Only files whose name passes 'accept' are stat'ed, in batches spread over the
+    same pool so a single large flat directory is not stat'ed serially.
+    """
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = {pool.submit(_scan_dir, root, accept)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                found, to_stat, subdirs = fut.result()
+                pending.update(
+                    pool.submit(_stat_batch, to_stat[i:i + _STAT_BATCH])
+                    for i in range(0, len(to_stat), _STAT_BATCH)
+                )
+                pending.update(pool.submit(_scan_dir, d, accept) for d in subdirs)
+                if found.paths:
+                    yield found
+
+def _scandir_parallel(
+    root: str,
+    accept: Optional[Callable[[str], bool]] = None,
+    workers: int = _SCAN_WORKERS,
+) -> _ScannedFiles:
+    """Recursively collect every accepted file under 'root'; see _iter_scandir_parallel."""
+    files = _ScannedFiles.empty()
+    for found in _iter_scandir_parallel(root, accept, workers):
+        files.extend(found)
+    return files
+
+def _is_dir(p: Path) -> bool:
+    """exists() and is_dir() in a single stat."""
+    try:
+        return stat.S_ISDIR(os.stat(p).st_mode)
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
+def _lora_name_filter(
+    allowed_suffixes: Tuple[str, ...],
+    exclude_names: Tuple[str, ...],
+) -> Callable[[str], bool]:
+    """Build the file-name predicate for allowed extensions and excluded name substrings."""
+    # One compiled alternation scans each name once for every excluded substring
+    excluded = (
+        re.compile("|".join(map(re.escape, exclude_names)), re.IGNORECASE).search
+        if exclude_names else None
+    )
+
+    # Common spellings checked in one C-level endswith; other casings fall back to lower()
+    suffix_variants = tuple(
+        v for ext in allowed_suffixes for v in dict.fromkeys((ext, ext.upper(), ext.title()))
+    )
+
+    def _accept(name: str) -> bool:
+        if (
+            suffix_variants
+            and not name.endswith(suffix_variants)
+            and not name.lower().endswith(allowed_suffixes)
+        ):
+            return False
+        return excluded is None or excluded(name) is None
+
+    return _accept
 
 def _collect_lora_files(
     loras_dir: Path,
     allowed_suffixes: Tuple[str, ...],
     exclude_names: Tuple[str, ...],
-) -> List[Path]:
-    """Recursively collect files in loras_dir filtered by extension and excluded name substrings."""
-    files: List[Path] = []
-    if not loras_dir.exists() or not loras_dir.is_dir():
-        return files
-
-    for f in loras_dir.rglob("*"):
-        if not f.is_file():
-            continue
-        if allowed_suffixes and f.suffix.lower() not in allowed_suffixes:
-            continue
-        name_lower = f.name.lower()
-        if any(x in name_lower for x in exclude_names):
-            continue
-        files.append(f)
-
-    return files
+) -> _ScannedFiles:
+    """
+    Recursively collect files in loras_dir filtered by extension and excluded name substrings.
+    Mtime and size are carried alongside each path so callers never need to stat a file twice.
+    """
+    if not _is_dir(loras_dir):
+        return _ScannedFiles.empty()
+    return _scandir_parallel(str(loras_dir), _lora_name_filter(allowed_suffixes, exclude_names))
+
+def _iter_oldest_first(
+    mtimes: array,
+    paths: List[str],
+    candidates: List[int],
+    k: int,
+) -> Iterator[int]:
+    """
+    Yield candidate indices oldest first, ties broken by path.
+    The first k come from a heap selection, which is all a typical purge needs;
+    if the caller asks for more, the rest is sorted once. When k is already a
+    fair share of the candidates, they are sorted straight away.
+    """
+    key = lambda i: (mtimes[i], paths[i])
+    if k * _SORT_REST_FRACTION < len(candidates):
+        batch = heapq.nsmallest(k, candidates, key=key)
+        yield from batch
+        last = key(batch[-1])
+        candidates = [i for i in candidates if key(i) > last]
+    yield from sorted(candidates, key=key)
+
+class _PurgeCandidates:
+    """
+    Iterate (path, size) for deletable LoRAs, oldest first; files younger than
+    min_age_seconds are never yielded.
+    For small delete limits the oldest few are picked with a bounded heap while
+    the scan streams, so the whole tree is never held in memory. Only if the
+    caller wants more than those (some could not be deleted) is it collected.
+    'has_more' says whether another candidate exists without fetching it.
+    """
 
-def _mtime_safe(p: Path) -> float:
-    try:
-        return p.stat().st_mtime
-    except FileNotFoundError:
-        return time.time()
-
-def _folder_size(p: Path) -> int:
-    total = 0
-    if not p.exists():
-        return 0
-    for f in p.rglob("*"):
-        if f.is_file():
-            try:
-                total += f.stat().st_size
-            except FileNotFoundError:
-                pass
-    return total
+    def __init__(
+        self,
+        loras_dir: Path,
+        allowed_suffixes: Tuple[str, ...],
+        exclude_names: Tuple[str, ...],
+        *,
+        min_age_seconds: int,
+        delete_count_limit: int,
+        bytes_needed: float,
+        now: float,
+    ) -> None:
+        self.loras_dir = loras_dir
+        self.allowed_suffixes = allowed_suffixes
+        self.exclude_names = exclude_names
+        self.min_age_seconds = min_age_seconds
+        self.delete_count_limit = delete_count_limit
+        self.bytes_needed = bytes_needed
+        self.now = now
+        # Eligible files known so far, and how many of them were handed out
+        self.eligible = 0
+        self.handed_out = 0
+
+    @property
+    def has_more(self) -> bool:
+        return self.handed_out < self.eligible
+
+    def _is_old_enough(self, mtime: float) -> bool:
+        return self.min_age_seconds <= 0 or (self.now - mtime) >= self.min_age_seconds
+
+    def __iter__(self) -> Iterator[Tuple[str, int]]:
+        after = None
+        if 0 < self.delete_count_limit <= _STREAM_SELECT_MAX:
+            if not _is_dir(self.loras_dir):
+                return
+            oldest = heapq.nsmallest(self.delete_count_limit, self._stream_eligible())
+            for _, path, size in oldest:
+                self.handed_out += 1
+                yield path, size
+            if not self.has_more:
+                return
+            # Resume strictly after the last file already handed out
+            after = oldest[-1][:2]
+
+        paths, mtimes, sizes = _collect_lora_files(
+            self.loras_dir, self.allowed_suffixes, self.exclude_names
+        )
+        candidates = [
+            i for i in range(len(paths))
+            if self._is_old_enough(mtimes[i])
+            and (after is None or (mtimes[i], paths[i]) > after)
+        ]
+        self.eligible = self.handed_out + len(candidates)
+
+        # Usually only a handful of the oldest files go; size the first heap
+        # selection from the delete limit, or from how many average-sized files
+        # it should take to reach target
+        if self.delete_count_limit:
+            first_k = self.delete_count_limit
+        else:
+            avg_size = (sum(sizes) / len(sizes)) if sizes else 1
+            first_k = int(2 * self.bytes_needed / (avg_size or 1)) + 1
+        for i in _iter_oldest_first(mtimes, paths, candidates, max(first_k, _MIN_SELECT_K)):
+            self.handed_out += 1
+            yield paths[i], sizes[i]
+
+    def _stream_eligible(self) -> Iterator[Tuple[float, str, int]]:
+        """Yield (mtime, path, size) of eligible files as the scan finds them, counting them."""
+        for found in _iter_scandir_parallel(
+            str(self.loras_dir), _lora_name_filter(self.allowed_suffixes, self.exclude_names)
+        ):
+            for path, mtime, size in zip(*found):
+                if self._is_old_enough(mtime):
+                    self.eligible += 1
+                    yield mtime, path, size
+
+def _format_log_entry(tag: str, path: str, detail: object) -> str:
+    if tag == "dry":
+        return f"[DRY RUN] {path} ({_format_bytes(detail)})"
+    if tag == "deleted":
+        return f"Deleted {path} ({_format_bytes(detail)})"
+    if tag == "permission":
+        return f"[SKIP: permission] {path}"
+    if tag == "directory":
+        return f"[SKIP: directory] {path}"
+    return f"[SKIP: {path}] {detail}"
 
 def _purge_oldest_until_below(
     root_for_usage: Path,
@@ -83,12 +345,19 @@ def _purge_oldest_until_below(
     min_age_seconds: int,
     delete_count_limit: int,
     dry_run: bool,
+    usage: Optional[_DiskUsage] = None,
+    verbose: bool = True,
 ) -> dict:
     """
     Delete oldest files in LoRAs until disk used% < target_percent.
+    'usage' may carry a snapshot of root_for_usage already taken by the caller.
+    Unless 'verbose', only the first and last _LOG_EDGE_ENTRIES deletions are logged.
     Returns summary with before/after usage, files deleted and bytes freed.
     """
-    before_used_pct = _disk_usage_percent(root_for_usage)
+    if usage is None:
+        usage = _disk_usage(root_for_usage)
+    total = usage.total or 1
+    before_used_pct = usage.used_pct
 
     if before_used_pct < threshold_percent:
         return {
@@ -100,12 +369,20 @@ def _purge_oldest_until_below(
             "log": f"Disk usage OK: {before_used_pct:.2f}% < {threshold_percent:.2f}% (no purge).",
         }
 
-    files = _collect_lora_files(loras_dir, allowed_suffixes, exclude_names)
-    files.sort(key=_mtime_safe)
-
-    now = time.time()
+    candidates = _PurgeCandidates(
+        loras_dir,
+        allowed_suffixes,
+        exclude_names,
+        min_age_seconds=min_age_seconds,
+        delete_count_limit=delete_count_limit,
+        bytes_needed=usage.used - (target_percent / 100.0) * total,
+        now=time.time(),
+    )
     bytes_freed = 0
     files_deleted = 0
+    # Running estimate of used bytes, so we need not statvfs after every unlink
+    used_estimate = usage.used
+    deleted_since_sync = 0
     lines = [
         f"Disk usage {before_used_pct:.2f}% ≥ {threshold_percent:.2f}% — purging LoRAs in {loras_dir}...",
         f"Target after purge: < {target_percent:.2f}%",
@@ -115,53 +392,132 @@ def _purge_oldest_until_below(
         "",
         "Deletions (oldest first):",
     ]
+    # Per-file (tag, path, size-or-error) records; formatted once at the end
+    entries: List[Optional[Tuple[str, str, object]]] = []
 
-    # Loop deleting oldest until we’re below target or out of files/limits
-    for f in files:
-        if delete_count_limit and files_deleted >= delete_count_limit:
-            lines.append(f"[STOP] Reached delete_count_limit = {delete_count_limit}")
-            break
+    outcome = ""
 
-        try:
-            st = f.stat()
-        except FileNotFoundError:
-            continue
-
-        if min_age_seconds > 0 and (now - st.st_mtime) < min_age_seconds:
-            # File is too fresh to delete
-            continue
-
-        size = st.st_size
-
-        if dry_run:
+    if dry_run:
+        # Loop simulating oldest first until we’d be below target or out of files/limits
+        for f, size in candidates:
             files_deleted += 1
             bytes_freed += size
-            lines.append(f"[DRY RUN] {f} ({_format_bytes(size)})")
-        else:
-            try:
-                f.unlink(missing_ok=True)
-                files_deleted += 1
-                bytes_freed += size
-                lines.append(f"Deleted {f} ({_format_bytes(size)})")
-            except PermissionError:
-                lines.append(f"[SKIP: permission] {f}")
-            except IsADirectoryError:
-                lines.append(f"[SKIP: directory] {f}")
-            except Exception as e:
-                lines.append(f"[SKIP: {f}] {e}")
-
-        # Re-check usage after each deletion to stop early
-        after_used_pct_now = _disk_usage_percent(root_for_usage)
-        if after_used_pct_now < target_percent:
-            lines.append(f"[OK] Reached target: used {after_used_pct_now:.2f}% < {target_percent:.2f}%")
-            break
-
-    after_used_pct = _disk_usage_percent(root_for_usage)
-    lines[:0] = [
-        f"Freed total: {_format_bytes(bytes_freed)}; Files deleted: {files_deleted}",
-        f"Usage before: {before_used_pct:.2f}%, after: {after_used_pct:.2f}%",
-        "",
-    ]
+            used_estimate -= size
+            entries.append(("dry", f, size))
+
+            # Nothing really changes on disk, so the estimate is all we have
+            estimated_pct = (used_estimate / total) * 100.0
+            if estimated_pct < target_percent:
+                outcome = f"[OK] Would reach target: used ~{estimated_pct:.2f}% < {target_percent:.2f}%"
+                break
+            # Stop before fetching another candidate, which could force a full rescan
+            if delete_count_limit and files_deleted >= delete_count_limit:
+                if candidates.has_more:
+                    outcome = f"[STOP] Reached delete_count_limit = {delete_count_limit}"
+                break
+    else:
+        # Unlinks run on a small pool so several metadata commits are in flight.
+        # Each future maps to (path, size, its slot in entries) so the log stays
+        # oldest first whatever order the unlinks finish in.
+        in_flight: Dict[Future, Tuple[str, int, int]] = {}
+        pending_bytes = 0
+
+        def _settle(return_when: str) -> None:
+            nonlocal files_deleted, deleted_since_sync, bytes_freed, used_estimate, pending_bytes
+            done, _ = wait(in_flight, return_when=return_when)
+            for fut in done:
+                f, size, slot = in_flight.pop(fut)
+                pending_bytes -= size
+                e = fut.exception()
+                # FileNotFoundError: already gone; same as Path.unlink(missing_ok=True)
+                if e is None or isinstance(e, FileNotFoundError):
+                    files_deleted += 1
+                    deleted_since_sync += 1
+                    bytes_freed += size
+                    used_estimate -= size
+                    entries[slot] = ("deleted", f, size)
+                elif isinstance(e, PermissionError):
+                    entries[slot] = ("permission", f, None)
+                elif isinstance(e, IsADirectoryError):
+                    entries[slot] = ("directory", f, None)
+                else:
+                    entries[slot] = ("error", f, e)
+
+        def _sync_reached_target() -> bool:
+            """Re-read real usage; True (with the [OK] outcome set) once under target."""
+            nonlocal used_estimate, deleted_since_sync, outcome
+            deleted_since_sync = 0
+            used_estimate = _disk_usage(root_for_usage).used
+            after_used_pct_now = (used_estimate / total) * 100.0
+            if after_used_pct_now < target_percent:
+                outcome = f"[OK] Reached target: used {after_used_pct_now:.2f}% < {target_percent:.2f}%"
+                return True
+            return False
+
+        # Loop deleting oldest until we’re below target or out of files/limits
+        with ThreadPoolExecutor(max_workers=_UNLINK_WORKERS) as pool:
+            for f, size in candidates:
+                entries.append(None)
+                in_flight[pool.submit(os.unlink, f)] = (f, size, len(entries) - 1)
+                pending_bytes += size
+                if len(in_flight) >= _UNLINK_MAX_IN_FLIGHT:
+                    _settle(FIRST_COMPLETED)
+
+                # Queued unlinks count as freed, so we never queue more than needed.
+                # This is decided before fetching another candidate: pulling one past
+                # a met limit could force a full rescan.
+                limit_hit = delete_count_limit and files_deleted + len(in_flight) >= delete_count_limit
+                target_hit = ((used_estimate - pending_bytes) / total) * 100.0 < target_percent
+                resync_due = deleted_since_sync >= _USAGE_RESYNC_EVERY
+                if not (limit_hit or target_hit or resync_due):
+                    continue
+
+                # Drain, then decide with nothing in flight
+                _settle(ALL_COMPLETED)
+                # Confirm with the real filesystem once the estimate says we are
+                # done, and periodically to pick up other writers
+                estimated_pct = (used_estimate / total) * 100.0
+                if deleted_since_sync and (
+                    estimated_pct < target_percent or deleted_since_sync >= _USAGE_RESYNC_EVERY
+                ):
+                    if _sync_reached_target():
+                        break
+                if delete_count_limit and files_deleted >= delete_count_limit:
+                    if candidates.has_more:
+                        outcome = f"[STOP] Reached delete_count_limit = {delete_count_limit}"
+                    break
+
+            if in_flight:
+                _settle(ALL_COMPLETED)
+
+        if not outcome and deleted_since_sync and (used_estimate / total) * 100.0 < target_percent:
+            _sync_reached_target()
+
+    if dry_run or not files_deleted:
+        # We changed nothing on disk
+        after_used_pct = before_used_pct
+    else:
+        if deleted_since_sync:
+            used_estimate = _disk_usage(root_for_usage).used
+        after_used_pct = (used_estimate / total) * 100.0
+    # Write straight into one buffer instead of growing a list of every line
+    buf = io.StringIO()
+    buf.write(f"Freed total: {_format_bytes(bytes_freed)}; Files deleted: {files_deleted}\n")
+    buf.write(f"Usage before: {before_used_pct:.2f}%, after: {after_used_pct:.2f}%\n\n")
+    buf.write("\n".join(lines))
+    if verbose or len(entries) <= 2 * _LOG_EDGE_ENTRIES:
+        shown = [entries]
+    else:
+        shown = [entries[:_LOG_EDGE_ENTRIES], entries[-_LOG_EDGE_ENTRIES:]]
+    for i, part in enumerate(shown):
+        if i:
+            buf.write(f"\n... {len(entries) - 2 * _LOG_EDGE_ENTRIES} more ...")
+        for e in part:
+            buf.write("\n")
+            buf.write(_format_log_entry(*e))
+    if outcome:
+        buf.write("\n")
+        buf.write(outcome)
 
     return {
         "triggered": True,
@@ -169,22 +525,84 @@ def _purge_oldest_until_below(
         "after_used_pct": after_used_pct,
         "files_deleted": files_deleted,
         "bytes_freed": bytes_freed,
-        "log": "\n".join(lines),
+        "log": buf.getvalue(),
     }
 
-def _clear_user_trash() -> str:
+def _user_trash_path() -> Path:
+    return Path.home() / ".local/share/Trash/files"
+
+def _same_filesystem(a: Path, b: Path) -> bool:
+    """True if both paths live on the same device; assumed True if either cannot be stat'ed."""
+    try:
+        return os.stat(a).st_dev == os.stat(b).st_dev
+    except OSError:
+        return True
+
+def _trash_state_path() -> Path:
+    return Path.home() / ".cache/comfy-purge-loras.state"
+
+def _load_trash_state() -> dict:
+    try:
+        with open(_trash_state_path(), "r", encoding="utf-8") as fh:
+            state = json.load(fh)
+    except (OSError, ValueError):
+        return {}
+    # The file is user-writable; anything but the expected numbers means no cache
+    if not (
+        isinstance(state, dict)
+        and isinstance(state.get("last_trash_mtime_ns"), int)
+        and isinstance(state.get("last_trash_empty_at"), (int, float))
+        and not isinstance(state.get("last_trash_empty_at"), bool)
+    ):
+        return {}
+    return state
+
+def _save_trash_state(state: dict) -> None:
+    path = _trash_state_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(state, fh)
+    except OSError:
+        pass  # the cache is only an optimization
+
+def _clear_user_trash(skip_if_unchanged: bool = False) -> str:
     """
     Safely clear $HOME/.local/share/Trash/files using shutil.rmtree (no shell).
+    An empty trash is left alone and its mtime remembered; with 'skip_if_unchanged',
+    a trash whose mtime still matches (so still empty) is not even listed.
     Returns a log line including an approximate freed size.
     """
-    trash_path = Path.home() / ".local/share/Trash/files"
-    if not trash_path.exists():
+    trash_path = _user_trash_path()
+    try:
+        trash_mtime_ns = os.stat(trash_path).st_mtime_ns
+    except (FileNotFoundError, NotADirectoryError):
         return f"Trash folder not found at {trash_path}"
 
-    before = _folder_size(trash_path)
+    now = time.time()
+    if skip_if_unchanged:
+        state = _load_trash_state()
+        if (
+            state.get("last_trash_mtime_ns") == trash_mtime_ns
+            and now - state.get("last_trash_empty_at", 0) < _TRASH_STATE_MAX_AGE
+        ):
+            return f"Trash at {trash_path} unchanged since it was last found empty (skipped)"
+
+    try:
+        with os.scandir(trash_path) as it:
+            empty = next(it, None) is None
+    except OSError:
+        empty = False
+    if empty:
+        _save_trash_state({"last_trash_mtime_ns": trash_mtime_ns, "last_trash_empty_at": now})
+        return f"Trash at {trash_path} is already empty"
+
+    # Measure what rmtree frees from filesystem usage rather than walking the
+    # trash a second time just to sum its file sizes
+    before_used = _disk_usage(trash_path).used
     try:
         shutil.rmtree(trash_path, ignore_errors=True)
-        freed = _format_bytes(before)
+        freed = _format_bytes(max(0, before_used - _disk_usage(trash_path.parent).used))
         return f"Cleared trash at {trash_path}, freed ~{freed}"
     except Exception as e:
         return f"Failed to clear trash at {trash_path}: {e}"
@@ -246,6 +664,10 @@ class PurgeLoRAsWhenDiskFull:
                     "default": True,
                     "tooltip": "Simulate deletions and print log without removing files.",
                 }),
+                "verbose": ("BOOLEAN", {
+                    "default": True,
+                    "tooltip": "Log every deletion; when off, only the first and last 100 are listed.",
+                }),
             },
         }
 
@@ -264,15 +686,18 @@ class PurgeLoRAsWhenDiskFull:
         min_age_minutes: int = 0,
         delete_count_limit: int = 0,
         dry_run: bool = True,
+        verbose: bool = True,
     ):
         loras_dir = Path(loras_path).expanduser().resolve()
-        if not loras_dir.exists():
-            used = _disk_usage_percent(Path.cwd())
-            log = f"[WARN] LoRAs path does not exist: {loras_dir}\nCurrent usage (cwd): {used:.2f}%"
-            return (log, float(used), float(used), 0, 0)
-
         # The FS to check capacity on = the device holding loras_dir
         root_for_usage = loras_dir
+        loras_exists = loras_dir.exists()
+        # Snapshot once; the purge and the warning below both reuse it
+        usage = _disk_usage(root_for_usage if loras_exists else Path.cwd())
+        if not loras_exists:
+            used = usage.used_pct
+            log = f"[WARN] LoRAs path does not exist: {loras_dir}\nCurrent usage (cwd): {used:.2f}%"
+            return (log, float(used), float(used), 0, 0)
 
         # normalize CSV inputs
         def _csv_list(s: str) -> List[str]:
@@ -288,21 +713,43 @@ class PurgeLoRAsWhenDiskFull:
         if target_percent >= threshold_percent:
             target_percent = threshold_percent - 1.0
 
-        # Purge LoRAs if needed
-        res = _purge_oldest_until_below(
-            root_for_usage=root_for_usage,
-            loras_dir=loras_dir,
-            threshold_percent=float(threshold_percent),
-            target_percent=float(target_percent),
-            allowed_suffixes=allowed_suffixes,
-            exclude_names=exclude_names,
-            min_age_seconds=int(min_age_minutes * 60),
-            delete_count_limit=int(delete_count_limit or 0),
-            dry_run=bool(dry_run),
+        # The trash and the LoRAs are independent trees, so clear the trash while
+        # the purge runs. If the purge will really delete on the trash's own
+        # filesystem, stay sequential: each side's usage readings would otherwise
+        # count the other's frees.
+        triggered = usage.used_pct >= threshold_percent
+        overlap_trash = (
+            bool(dry_run)
+            or not triggered
+            or not _same_filesystem(loras_dir, _user_trash_path())
         )
-
-        # Always attempt to clear trash; report freed size
-        trash_log = _clear_user_trash()
+        # With nothing to purge, a trash already found empty and untouched since is skipped
+        skip_trash_if_unchanged = not triggered
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            trash_future = (
+                pool.submit(_clear_user_trash, skip_trash_if_unchanged) if overlap_trash else None
+            )
+
+            # Purge LoRAs if needed
+            res = _purge_oldest_until_below(
+                root_for_usage=root_for_usage,
+                loras_dir=loras_dir,
+                threshold_percent=float(threshold_percent),
+                target_percent=float(target_percent),
+                allowed_suffixes=allowed_suffixes,
+                exclude_names=exclude_names,
+                min_age_seconds=int(min_age_minutes * 60),
+                delete_count_limit=int(delete_count_limit or 0),
+                dry_run=bool(dry_run),
+                usage=usage,
+                verbose=bool(verbose),
+            )
+
+            # Always attempt to clear trash; report freed size
+            trash_log = (
+                trash_future.result() if trash_future else _clear_user_trash(skip_trash_if_unchanged)
+            )
         log = res["log"] + "\n\n" + trash_log
 
         return (
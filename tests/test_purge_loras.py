@@ -0,0 +1,240 @@
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import comfy_purge_loras as cpl
+
+
+class PurgeDeleteLimitTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.loras = Path(self._tmp.name)
+        now = time.time()
+        for i in range(50):
+            p = self.loras / f"lora{i:02d}.safetensors"
+            p.write_bytes(b"x" * (100 + i))
+            os.utime(p, (now - 10000 + i, now - 10000 + i))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _purge(self, limit, dry_run):
+        # threshold/target 0% always triggers and never reaches target
+        return cpl._purge_oldest_until_below(
+            self.loras,
+            self.loras,
+            0.0,
+            0.0,
+            allowed_suffixes=(".safetensors",),
+            exclude_names=(),
+            min_age_seconds=0,
+            delete_count_limit=limit,
+            dry_run=dry_run,
+        )
+
+    def test_small_limit_does_not_rescan_tree(self):
+        for dry_run in (True, False):
+            with self.subTest(dry_run=dry_run), \
+                    mock.patch.object(cpl, "_collect_lora_files", wraps=cpl._collect_lora_files) as collect:
+                res = self._purge(3, dry_run)
+                self.assertEqual(res["files_deleted"], 3)
+                self.assertIn("[STOP] Reached delete_count_limit = 3", res["log"])
+                collect.assert_not_called()
+
+        remaining = sorted(p.name for p in self.loras.iterdir())
+        self.assertEqual(remaining[0], "lora03.safetensors")
+
+    def test_large_limit_selects_oldest_once(self):
+        limit = cpl._MIN_SELECT_K + 4
+        for dry_run in (True, False):
+            with self.subTest(dry_run=dry_run), \
+                    mock.patch.object(cpl.heapq, "nsmallest", wraps=cpl.heapq.nsmallest) as nsmallest:
+                res = self._purge(limit, dry_run)
+                self.assertEqual(res["files_deleted"], limit)
+                self.assertIn(f"[STOP] Reached delete_count_limit = {limit}", res["log"])
+                self.assertLessEqual(nsmallest.call_count, 1)
+
+    def test_equal_mtimes_break_ties_by_path(self):
+        same = time.time() - 10000
+        for p in self.loras.iterdir():
+            os.utime(p, (same, same))
+        expected = sorted(str(p) for p in self.loras.iterdir())
+        # 3 takes the streaming heap path, 12 the full collection
+        for limit in (3, 12):
+            with self.subTest(limit=limit):
+                res = self._purge(limit, True)
+                dry = [line.split(" ", 2)[2].rsplit(" (", 1)[0]
+                       for line in res["log"].splitlines() if line.startswith("[DRY RUN]")]
+                self.assertEqual(dry, expected[:limit])
+
+    def test_no_stop_line_when_limit_matches_candidates(self):
+        for p in sorted(self.loras.iterdir())[3:]:
+            p.unlink()
+        res = self._purge(3, True)
+        self.assertEqual(res["files_deleted"], 3)
+        self.assertNotIn("[STOP]", res["log"])
+
+
+class PurgeUnlinkLoopTest(unittest.TestCase):
+    TOTAL = 100_000
+    BASE_USED = 10_000
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.loras = Path(self._tmp.name)
+        now = time.time()
+        # Oldest first: lora00 (1000 B), lora01 (1001 B), ...
+        self.oldest_first = []
+        for i in range(80):
+            p = self.loras / f"lora{i:02d}.safetensors"
+            p.write_bytes(b"x" * (1000 + i))
+            os.utime(p, (now - 10000 + i, now - 10000 + i))
+            self.oldest_first.append(p)
+
+    def _tree_usage(self, path):
+        used = self.BASE_USED + sum(p.stat().st_size for p in self.loras.iterdir())
+        return cpl._DiskUsage(self.TOTAL, used)
+
+    def _purge(self, target_percent, limit=0):
+        return cpl._purge_oldest_until_below(
+            self.loras,
+            self.loras,
+            target_percent,
+            target_percent,
+            allowed_suffixes=(".safetensors",),
+            exclude_names=(),
+            min_age_seconds=0,
+            delete_count_limit=limit,
+            dry_run=False,
+        )
+
+    def _logged_paths(self, log):
+        return [line.split(" ", 1)[1].rsplit(" (", 1)[0] if line.startswith("Deleted ")
+                else line.split("] ", 1)[1]
+                for line in log.splitlines() if line.startswith(("Deleted ", "[SKIP"))]
+
+    def test_target_reached_with_unlinks_in_flight(self):
+        target = 40.0
+        # What the serial loop deletes: the shortest oldest-first prefix that
+        # brings usage under target
+        used = self._tree_usage(None).used
+        expected = []
+        for p in self.oldest_first:
+            expected.append(p.name)
+            used -= p.stat().st_size
+            if used / self.TOTAL * 100 < target:
+                break
+        self.assertGreater(len(expected), cpl._UNLINK_MAX_IN_FLIGHT)
+
+        with mock.patch.object(cpl, "_disk_usage", side_effect=self._tree_usage):
+            res = self._purge(target)
+
+        gone = [p.name for p in self.oldest_first if not p.exists()]
+        self.assertEqual(gone, expected)
+        self.assertEqual(res["files_deleted"], len(expected))
+        self.assertIn("[OK] Reached target", res["log"])
+
+    def test_skipped_files_keep_log_oldest_first(self):
+        real_unlink = os.unlink
+
+        def flaky_unlink(path, *args, **kwargs):
+            if path.endswith(("0.safetensors", "7.safetensors")):
+                raise PermissionError(13, "denied", path)
+            return real_unlink(path, *args, **kwargs)
+
+        with mock.patch.object(cpl.os, "unlink", side_effect=flaky_unlink):
+            res = self._purge(0.0, limit=20)
+
+        logged = self._logged_paths(res["log"])
+        self.assertEqual(logged, [str(p) for p in self.oldest_first[:len(logged)]])
+        self.assertEqual(res["files_deleted"], 20)
+        skipped = [line for line in res["log"].splitlines() if line.startswith("[SKIP: permission]")]
+        self.assertEqual(len(skipped), len(logged) - 20)
+        self.assertTrue(skipped)
+
+    def test_resync_picks_up_space_freed_by_others(self):
+        calls = []
+
+        def usage(path):
+            calls.append(path)
+            # Too big a disk for our deletions to reach target by estimate;
+            # after the first reading someone else frees most of it
+            used = 900_000 if len(calls) == 1 else 50_000
+            return cpl._DiskUsage(1_000_000, used)
+
+        with mock.patch.object(cpl, "_disk_usage", side_effect=usage):
+            res = self._purge(50.0)
+
+        self.assertEqual(len(calls), 2)
+        self.assertIn("[OK] Reached target: used 5.00%", res["log"])
+        self.assertGreaterEqual(res["files_deleted"], cpl._USAGE_RESYNC_EVERY)
+        self.assertLess(res["files_deleted"], cpl._USAGE_RESYNC_EVERY + cpl._UNLINK_MAX_IN_FLIGHT)
+
+
+class CollectLoraFilesTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.loras = Path(self._tmp.name)
+
+    @unittest.skipUnless(hasattr(os, "symlink"), "needs symlinks")
+    def test_bad_symlinks_are_skipped(self):
+        (self.loras / "good.safetensors").write_bytes(b"x" * 10)
+        (self.loras / "plain").write_bytes(b"")
+        try:
+            # a <-> b loop (ELOOP) and a link through a non-directory (ENOTDIR)
+            os.symlink("b.safetensors", self.loras / "a.safetensors")
+            os.symlink("a.safetensors", self.loras / "b.safetensors")
+            os.symlink("plain/x", self.loras / "bad.safetensors")
+        except OSError as e:
+            self.skipTest(f"cannot create symlinks: {e}")
+
+        paths, _, sizes = cpl._collect_lora_files(self.loras, (".safetensors",), ())
+        self.assertEqual([Path(p).name for p in paths], ["good.safetensors"])
+        self.assertEqual(list(sizes), [10])
+
+
+class TrashStateTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        home = Path(self._tmp.name)
+        self.trash = home / ".local/share/Trash/files"
+        self.trash.mkdir(parents=True)
+        self.state = home / ".cache/comfy-purge-loras.state"
+        self.state.parent.mkdir(parents=True)
+        patcher = mock.patch.object(cpl.Path, "home", return_value=home)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self._tmp.cleanup)
+
+    def test_corrupt_state_does_not_skip_or_crash(self):
+        mtime_ns = os.stat(self.trash).st_mtime_ns
+        for bad in (
+            '{"last_trash_mtime_ns": %d, "last_trash_empty_at": "yesterday"}' % mtime_ns,
+            '{"last_trash_mtime_ns": "x", "last_trash_empty_at": 1}',
+            "[1, 2]",
+            "not json",
+        ):
+            with self.subTest(state=bad):
+                self.state.write_text(bad)
+                self.assertIn("already empty", cpl._clear_user_trash(skip_if_unchanged=True))
+
+    def test_trash_parent_not_a_directory(self):
+        share = self.trash.parent.parent
+        self.trash.rmdir()
+        self.trash.parent.rmdir()
+        share.rmdir()
+        share.write_text("not a directory")
+        self.assertIn("Trash folder not found", cpl._clear_user_trash())
+
+    def test_unchanged_empty_trash_is_skipped(self):
+        cpl._clear_user_trash(skip_if_unchanged=True)
+        self.assertIn("skipped", cpl._clear_user_trash(skip_if_unchanged=True))
+
+
+if __name__ == "__main__":
+    unittest.main()